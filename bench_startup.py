@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for tcx_erg_to_pbintervals.py
+Runs the --version and --check fast paths in fresh interpreters under
+-X importtime and fails if either imports a heavy module or goes over the
+startup budget
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CONVERTER = Path(__file__).parent / "tcx_erg_to_pbintervals.py"
+
+# Modules the fast path must never load - they belong to the conversion path
+HEAVY_MODULES = ['xml.etree.ElementTree', 'csv', 'argparse', 'datetime', 'traceback', 'array']
+
+def run_importtime(args):
+    """Run a fresh interpreter with -X importtime, return (wall_ms, {module: self_us})"""
+    cmd = [sys.executable, "-X", "importtime"] + args
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    # Lines look like "import time:       410 |        410 |   _distutils_hack"
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        imports[fields[2].strip()] = int(fields[0])
+
+    return wall_ms, imports
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the cold-start time of the converter CLI')
+    parser.add_argument('-n', '--runs', type=int, default=10, help='Number of fresh interpreter runs (default: 10)')
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                        help='Maximum median wall time for --version and --check, in milliseconds (default: 100)')
+    parser.add_argument('--import-budget-ms', type=float, default=5.0,
+                        help='Maximum import time on top of a bare interpreter, in milliseconds (default: 5)')
+    args = parser.parse_args()
+
+    # --check only opens its inputs, so empty placeholder files are enough
+    tmp_dir = tempfile.mkdtemp()
+    tcx_file = Path(tmp_dir) / "bench.tcx"
+    erg_file = Path(tmp_dir) / "bench.erg"
+    tcx_file.touch()
+    erg_file.touch()
+
+    fast_paths = {
+        "--version": [str(CONVERTER), "--version"],
+        "--check": [str(CONVERTER), "--check", str(tcx_file), str(erg_file)],
+    }
+    baseline_walls = []
+    script_walls = {name: [] for name in fast_paths}
+    extra_import_ms = {name: [] for name in fast_paths}
+    loaded = {name: set() for name in fast_paths}
+
+    try:
+        for _ in range(args.runs):
+            wall_ms, baseline = run_importtime(["-c", "pass"])
+            baseline_walls.append(wall_ms)
+
+            for name, cmd_args in fast_paths.items():
+                wall_ms, imports = run_importtime(cmd_args)
+                script_walls[name].append(wall_ms)
+                loaded[name].update(imports)
+
+                extra = sum(us for module, us in imports.items() if module not in baseline)
+                extra_import_ms[name].append(extra / 1000)
+    finally:
+        tcx_file.unlink()
+        erg_file.unlink()
+        os.rmdir(tmp_dir)
+
+    print(f"Runs: {args.runs}")
+    print(f"Bare interpreter:    {statistics.median(baseline_walls):.1f}ms median")
+
+    failures = []
+    for name in fast_paths:
+        script_ms = statistics.median(script_walls[name])
+        import_ms = statistics.median(extra_import_ms[name])
+
+        print(f"Converter {name + ':':<10} {script_ms:.1f}ms median (budget {args.budget_ms:g}ms), "
+              f"extra imports {import_ms:.2f}ms (budget {args.import_budget_ms:g}ms)")
+
+        heavy = [module for module in HEAVY_MODULES if module in loaded[name]]
+        if heavy:
+            failures.append(f"{name} imported heavy modules: {', '.join(heavy)}")
+        if script_ms > args.budget_ms:
+            failures.append(f"{name} cold start {script_ms:.1f}ms exceeds budget of {args.budget_ms:g}ms")
+        if import_ms > args.import_budget_ms:
+            failures.append(f"{name} extra import time {import_ms:.2f}ms exceeds budget of {args.import_budget_ms:g}ms")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        sys.exit(1)
+
+    print("PASS")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Ride along with a Xert TCX + ERG workout in real time
+Announces each interval's CallName and target watts against the wall clock,
+with periodic target updates through ramps interpolated from the ERG profile.
+Cues go to the terminal or to a local UDP socket.
+"""
+
+import asyncio
+import argparse
+import statistics
+import sys
+
+from tcx_erg_to_pbintervals import (
+    parse_tcx_workout,
+    parse_erg_file,
+    add_power_to_steps,
+    format_call_name,
+    get_power_at_time,
+    seconds_to_hhmmss,
+)
+
+def build_cue_timeline(steps, power_profile, ramp_step=10):
+    """Precompute the (offset_sec, message) cues for the whole workout
+
+    steps must already be annotated by add_power_to_steps(). Every interval
+    gets a cue at its start; ramps (non-steady intervals) also get a target
+    update every ramp_step seconds, interpolated from the ERG profile.
+    All formatting happens here so the scheduler only has to send strings.
+    """
+    cues = []
+    for step in steps:
+        start_sec = step['start_sec']
+        end_sec = step['end_sec']
+        cues.append((start_sec, f"{seconds_to_hhmmss(start_sec)}  {format_call_name(step)}"
+                                f" -> target {step['start_power']}W"))
+
+        if step['is_steady'] or not ramp_step:
+            continue
+
+        # The k-th update is k steps after the interval start
+        k = 1
+        t = start_sec + k * ramp_step
+        while t < end_sec:
+            watts = get_power_at_time(power_profile, t, use_end_value=True)
+            cues.append((t, f"{seconds_to_hhmmss(t)}    target {int(round(watts))}W"))
+            k += 1
+            t = start_sec + k * ramp_step
+
+    total_duration = steps[-1]['end_sec'] if steps else 0
+    cues.append((total_duration, f"{seconds_to_hhmmss(total_duration)}  Workout complete"))
+    return cues
+
+async def run_cues(cues, emit, lateness, speed=1.0):
+    """Emit each cue at its offset from the start, measured on the loop's monotonic clock
+
+    Every deadline is measured from the same start time rather than from
+    the previous cue, so a late wakeup delays only its own cue. The lateness of each cue (seconds after its deadline that it
+    was actually sent) is appended to lateness as we go, so the caller
+    still has the statistics if the ride is interrupted.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    for offset, message in cues:
+        deadline = start + offset / speed
+        delay = deadline - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        emit(message)
+        lateness.append(loop.time() - deadline)
+
+async def ride_along(cues, lateness, speed=1.0, udp_addr=None):
+    """Play back the cue timeline on the terminal, or to udp_addr if given"""
+    if udp_addr is None:
+        def emit(message):
+            sys.stdout.write(message + '\n')
+            sys.stdout.flush()
+
+        await run_cues(cues, emit, lateness, speed)
+        return
+
+    loop = asyncio.get_running_loop()
+    try:
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=udp_addr)
+    except (OSError, OverflowError) as e:
+        print(f"Error: cannot open UDP socket to {udp_addr[0]}:{udp_addr[1]}: {e}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        def emit(message):
+            transport.sendto(message.encode('utf-8'))
+
+        await run_cues(cues, emit, lateness, speed)
+    finally:
+        transport.close()
+
+def print_lateness_stats(lateness, file=sys.stderr):
+    """Report how far behind schedule the cues were sent, in milliseconds"""
+    if not lateness:
+        print("No cues were sent", file=file)
+        return
+
+    ms = sorted(x * 1000 for x in lateness)
+    p95 = ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))]
+    jitter = statistics.pstdev(ms) if len(ms) > 1 else 0.0
+
+    print(f"Cues sent: {len(ms)}", file=file)
+    print(f"Lateness: mean {statistics.mean(ms):.2f}ms, median {statistics.median(ms):.2f}ms, "
+          f"p95 {p95:.2f}ms, max {ms[-1]:.2f}ms", file=file)
+    print(f"Jitter (std dev): {jitter:.2f}ms", file=file)
+
+def parse_udp_address(value):
+    """Parse HOST:PORT for the --udp option"""
+    host, sep, port = value.rpartition(':')
+    if not sep or not host:
+        raise argparse.ArgumentTypeError(f"expected HOST:PORT, got '{value}'")
+    try:
+        port = int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port in '{value}'")
+    if not 1 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"port must be 1-65535, got {port}")
+    return host, port
+
+def main():
+    parser = argparse.ArgumentParser(description='Play back a Xert TCX + ERG workout as live interval cues')
+    parser.add_argument('tcx_file', help='Input TCX file')
+    parser.add_argument('erg_file', help='Input ERG file')
+    parser.add_argument('--ramp-step', type=float, default=10,
+                        help='Seconds between target updates during ramps, at least 1 (0 to disable, default: 10)')
+    parser.add_argument('--udp', type=parse_udp_address, default=None, metavar='HOST:PORT',
+                        help='Send cues as UDP datagrams instead of printing them')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Playback speed multiplier, e.g. 60 to rehearse a workout in minutes (default: 1)')
+
+    args = parser.parse_args()
+
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    if args.ramp_step != 0 and args.ramp_step < 1:
+        parser.error("--ramp-step must be 0 (disabled) or at least 1 second")
+
+    try:
+        workout_name, steps = parse_tcx_workout(args.tcx_file)
+        _, power_profile = parse_erg_file(args.erg_file)
+
+        if not power_profile:
+            print("Error: No power data found in ERG file", file=sys.stderr)
+            sys.exit(1)
+
+        add_power_to_steps(steps, power_profile)
+        cues = build_cue_timeline(steps, power_profile, args.ramp_step)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    print(f"Riding along: {workout_name} ({len(steps)} intervals, "
+          f"{seconds_to_hhmmss(steps[-1]['end_sec'] if steps else 0)})", file=sys.stderr)
+
+    lateness = []
+    try:
+        asyncio.run(ride_along(cues, lateness, args.speed, args.udp))
+    except KeyboardInterrupt:
+        print("\nStopped early", file=sys.stderr)
+
+    print_lateness_stats(lateness)
+
+if __name__ == '__main__':
+    main()
@@ -5,18 +5,19 @@ Uses TCX for interval names/structure and ERG for accurate power data
 No heuristics - just shows the power progression for each interval
 """
 
-import xml.etree.ElementTree as ET
-import csv
+# Only sys is imported at module level so that the --version/--check fast
+# path starts quickly; each function imports the heavier modules it needs.
 import sys
-from datetime import timedelta
-import argparse
+
+__version__ = '1.1.0'
 
 def seconds_to_hhmmss(seconds):
     """Convert seconds to HH:MM:SS format"""
-    td = timedelta(seconds=int(seconds))
-    hours = td.seconds // 3600
-    minutes = (td.seconds % 3600) // 60
-    secs = td.seconds % 60
+    # Wraps at 24 hours, like timedelta.seconds
+    total = int(seconds) % 86400
+    hours = total // 3600
+    minutes = (total % 3600) // 60
+    secs = total % 60
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 def parse_erg_file(erg_file):
@@ -106,8 +107,46 @@ def get_power_at_time(power_profile, time_sec, use_end_value=False):
     # If we're before the start, return the first power
     return power_profile[0][1]
 
+def iter_resampled_power(power_profile, rate_hz=1.0):
+    """Yield (time_sec, watts) for the whole ERG profile at a fixed sample rate
+
+    Walks the profile and the sample times together in a single pass, instead
+    of calling get_power_at_time() once per sample.
+
+    A sample that lands on a transition (duplicate timestamp) takes the power
+    AFTER the transition, like get_power_at_time(..., use_end_value=True), and
+    interpolation never crosses a transition. Samples run from 0 up to the
+    last ERG timestamp; the TCX tolerance is not applied since the sample
+    grid doesn't come from TCX boundaries.
+    """
+    if not power_profile:
+        return
+
+    last = len(power_profile) - 1
+    num_samples = int(power_profile[-1][0] * rate_hz + 1e-9) + 1
+    i = 0
+
+    for n in range(num_samples):
+        # Sample n is at exactly n / rate_hz, however long the workout
+        time_sec = n / rate_hz
+
+        # Advance to the last point at or before this sample; on a run of
+        # duplicate timestamps that is the value after the transition
+        while i < last and power_profile[i + 1][0] <= time_sec + 0.01:
+            i += 1
+
+        t1, p1 = power_profile[i]
+        if i == last or time_sec <= t1:
+            yield time_sec, p1
+        else:
+            t2, p2 = power_profile[i + 1]
+            ratio = (time_sec - t1) / (t2 - t1)
+            yield time_sec, p1 + ratio * (p2 - p1)
+
 def parse_tcx_workout(tcx_file):
     """Parse TCX file and extract workout steps"""
+    import xml.etree.ElementTree as ET
+
     tree = ET.parse(tcx_file)
     root = tree.getroot()
     
@@ -165,10 +204,12 @@ def get_interval_color(power, ftp=277):
     else:  # Neuromuscular
         return "#FF0000"  # Red
 
-def create_pbintervals_csv(workout_name, steps, power_profile, output_file, ftp):
-    """Create PB Intervals CSV file from workout steps with ERG power data"""
-    
-    # Add power data from ERG to each step
+def add_power_to_steps(steps, power_profile):
+    """Annotate each step in place with start/end/avg power from the ERG profile
+
+    Also records 'start_sec' and 'end_sec' (seconds from workout start) so
+    callers can lay the steps out on a timeline.
+    """
     current_time = 0
     for step in steps:
         start_sec = current_time
@@ -180,6 +221,8 @@ def create_pbintervals_csv(workout_name, steps, power_profile, output_file, ftp)
         # For end, use power BEFORE any transition at this time
         end_power = get_power_at_time(power_profile, end_sec, use_end_value=False)
         
+        step['start_sec'] = start_sec
+        step['end_sec'] = end_sec
         step['start_power'] = int(round(start_power))
         step['end_power'] = int(round(end_power))
         
@@ -194,6 +237,23 @@ def create_pbintervals_csv(workout_name, steps, power_profile, output_file, ftp)
             step['is_steady'] = True
         
         current_time = end_sec
+
+    return steps
+
+def format_call_name(step):
+    """Build the CallName text for a step annotated by add_power_to_steps()"""
+    if step['is_steady']:
+        # Show just the average if it's essentially steady
+        return f"{step['name']} [{step['avg_power']}W]"
+    # Show the ramp with average
+    return f"{step['name']} [{step['start_power']}-{step['end_power']}W, avg:{step['avg_power']}W]"
+
+def create_pbintervals_csv(workout_name, steps, power_profile, output_file, ftp):
+    """Create PB Intervals CSV file from workout steps with ERG power data"""
+    import csv
+    
+    # Add power data from ERG to each step
+    add_power_to_steps(steps, power_profile)
     
     # Create CSV rows
     rows = []
@@ -255,12 +315,7 @@ def create_pbintervals_csv(workout_name, steps, power_profile, output_file, ftp)
         row['CallDurationMaxHundredths'] = ''
         
         # Interval-specific data with power info from ERG
-        if step['is_steady']:
-            # Show just the average if it's essentially steady
-            row['CallName'] = f"{step['name']} [{step['avg_power']}W]"
-        else:
-            # Show the ramp with average
-            row['CallName'] = f"{step['name']} [{step['start_power']}-{step['end_power']}W, avg:{step['avg_power']}W]"
+        row['CallName'] = format_call_name(step)
         
         row['CallColour'] = get_interval_color(step['avg_power'], ftp)
         row['CallDurationMin'] = seconds_to_hhmmss(step['duration'])
@@ -287,16 +342,97 @@ def create_pbintervals_csv(workout_name, steps, power_profile, output_file, ftp)
     total_duration = sum(step['duration'] for step in steps)
     print(f"Total duration: {seconds_to_hhmmss(total_duration)}")
 
+def write_power_stream(power_profile, output_file, rate_hz=1.0):
+    """Export the ERG profile as a fixed-rate target power stream
+
+    The format follows the file extension:
+      .csv - 'time_sec,watts' rows
+      .npy - NumPy float32 array of watts (readable with numpy.load)
+      other - raw little-endian float32 watts, one per sample
+    For the binary formats the time of sample n is n / rate_hz.
+    """
+    samples = iter_resampled_power(power_profile, rate_hz)
+
+    if output_file.lower().endswith('.csv'):
+        import csv
+
+        count = 0
+        with open(output_file, 'w', newline='', encoding='ascii') as f:
+            writer = csv.writer(f)
+            writer.writerow(['time_sec', 'watts'])
+            for time_sec, watts in samples:
+                # Fixed-point then trimmed, so long workouts keep exact times
+                writer.writerow([f"{time_sec:.6f}".rstrip('0').rstrip('.'), f"{watts:.1f}"])
+                count += 1
+    else:
+        from array import array
+
+        watts = array('f', (w for _, w in samples))
+        count = len(watts)
+        if sys.byteorder == 'big':
+            watts.byteswap()
+
+        with open(output_file, 'wb') as f:
+            if output_file.lower().endswith('.npy'):
+                header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': ({count},), }}"
+                # Magic (6) + version (2) + header length (2) + header, padded to 64 bytes
+                header += ' ' * (63 - (10 + len(header)) % 64) + '\n'
+                f.write(b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('ascii'))
+            watts.tofile(f)
+
+    print(f"Created power stream: {output_file} ({count} samples at {rate_hz:g} Hz)")
+
+
+def check_inputs(paths):
+    """Fast path for --check: confirm the inputs can be opened, without parsing them"""
+    ok = True
+    for path in paths:
+        try:
+            with open(path, 'rb'):
+                pass
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            ok = False
+    if ok:
+        print(f"OK: tcx_erg_to_pbintervals {__version__}, Python {sys.version.split()[0]}")
+    return ok
 
 def main():
+    # Handle --version and --check before importing argparse or any parser
+    if len(sys.argv) > 1 and sys.argv[1] == '--version':
+        print(f"tcx_erg_to_pbintervals {__version__}")
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == '--check':
+        if len(sys.argv) != 4:
+            # Same shape and exit status as an argparse usage error
+            import os
+            prog = os.path.basename(sys.argv[0])
+            print(f"usage: {prog} --check tcx_file erg_file", file=sys.stderr)
+            print(f"{prog}: error: --check needs exactly a TCX file and an ERG file", file=sys.stderr)
+            sys.exit(2)
+        sys.exit(0 if check_inputs(sys.argv[2:]) else 1)
+
+    import argparse
+
     parser = argparse.ArgumentParser(description='Convert Xert TCX + ERG workout to PB Intervals CSV')
     parser.add_argument('tcx_file', help='Input TCX file')
     parser.add_argument('erg_file', help='Input ERG file')
     parser.add_argument('-o', '--output', help='Output CSV file', default=None)
     parser.add_argument('-f', '--ftp', type=float, help='Override FTP value from ERG file for zone colors', default=None)
+    parser.add_argument('--power-stream', help='Also export the ERG target power resampled at a fixed rate (.csv, .npy, or raw float32)', default=None)
+    parser.add_argument('--rate', type=float, help='Sample rate in Hz for --power-stream (default: 1)', default=1.0)
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    parser.add_argument('--check', action='store_true',
+                        help='Only check that the input files can be opened, without converting')
 
     args = parser.parse_args()
 
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+
+    if args.check:
+        sys.exit(0 if check_inputs([args.tcx_file, args.erg_file]) else 1)
+
     # Set output filename if not specified
     if args.output is None:
         args.output = args.tcx_file.replace('.tcx', '_pbintervals.csv')
@@ -324,6 +460,9 @@ def main():
         # Create PB Intervals CSV
         create_pbintervals_csv(workout_name, steps, power_profile, args.output, ftp)
 
+        if args.power_stream:
+            write_power_stream(power_profile, args.power_stream, args.rate)
+
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         import traceback
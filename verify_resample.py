@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Verify the --power-stream CSV export against get_power_at_time() on a long workout"""
+
+import csv
+import os
+import sys
+import tempfile
+
+from tcx_erg_to_pbintervals import get_power_at_time, write_power_stream
+
+RATE_HZ = 4
+
+# Synthetic 3h20m profile (12000 s): steady blocks, ramps and transitions
+# (duplicate timestamps) every 10 minutes, so the stream runs well past 10000 s
+power_profile = []
+for block in range(20):
+    start = block * 600.0
+    if block % 2 == 0:
+        power_profile += [(start, 150.0), (start + 600, 250.0)]  # ramp
+    else:
+        power_profile += [(start, 300.0), (start + 600, 300.0)]  # steady
+
+fd, stream_file = tempfile.mkstemp(suffix='.csv')
+os.close(fd)
+try:
+    write_power_stream(power_profile, stream_file, RATE_HZ)
+    with open(stream_file, 'r') as f:
+        rows = list(csv.DictReader(f))
+finally:
+    os.remove(stream_file)
+
+expected_samples = int(power_profile[-1][0] * RATE_HZ) + 1
+errors = []
+
+if len(rows) != expected_samples:
+    errors.append(f"expected {expected_samples} samples, got {len(rows)}")
+
+profile_times = sorted({t for t, _ in power_profile})
+
+for n, row in enumerate(rows):
+    # Times must be exactly n / rate, including past 10000 s
+    time_sec = float(row['time_sec'])
+    if time_sec != n / RATE_HZ:
+        errors.append(f"sample {n}: time {row['time_sec']} != {n / RATE_HZ}")
+        continue
+
+    # Compare power away from get_power_at_time()'s 2-second tolerance window
+    if min(abs(time_sec - t) for t in profile_times) < 2.0 and time_sec not in profile_times:
+        continue
+    expected = get_power_at_time(power_profile, time_sec, use_end_value=True)
+    if abs(float(row['watts']) - expected) > 0.06:  # CSV rounds to 0.1 W
+        errors.append(f"sample {n} ({time_sec}s): {row['watts']}W != {expected:.1f}W")
+
+print("=" * 60)
+print(f"Checked {len(rows)} samples at {RATE_HZ} Hz "
+      f"(last time {rows[-1]['time_sec'] if rows else 'n/a'}s)")
+if errors:
+    for error in errors[:20]:
+        print(f"❌ {error}")
+    if len(errors) > 20:
+        print(f"   ... and {len(errors) - 20} more")
+    print("=" * 60)
+    sys.exit(1)
+
+print("✅ All sample times and powers match")
+print("=" * 60)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Verify the ride-along cue timeline on a synthetic TCX + ERG pair"""
+
+import os
+import sys
+import tempfile
+
+from ride_along import build_cue_timeline
+from tcx_erg_to_pbintervals import (
+    parse_tcx_workout,
+    parse_erg_file,
+    add_power_to_steps,
+    get_power_at_time,
+)
+
+# Fractional, so a running float sum of steps would drift from start + k * step,
+# and it doesn't divide the ramp durations evenly
+RAMP_STEP = 2.3
+
+TCX = """<?xml version="1.0"?>
+<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2">
+  <Workouts><Workout><Name>Verify Ride Along</Name>
+    <Step><Name>Warmup</Name><Duration><Seconds>600</Seconds></Duration></Step>
+    <Step><Name>Threshold</Name><Duration><Seconds>300</Seconds></Duration></Step>
+    <Step><Name>Ramp Down</Name><Duration><Seconds>400</Seconds></Duration></Step>
+  </Workout></Workouts>
+</TrainingCenterDatabase>
+"""
+
+# Minutes and watts; duplicate timestamps mark the transitions at 10:00 and 15:00
+ERG = """[COURSE HEADER]
+FTP=280
+[END COURSE HEADER]
+[COURSE DATA]
+0\t100
+10\t220
+10\t290
+15\t290
+15\t260
+21.666667\t120
+[END COURSE DATA]
+"""
+
+tmp_dir = tempfile.mkdtemp()
+tcx_file = os.path.join(tmp_dir, 'verify.tcx')
+erg_file = os.path.join(tmp_dir, 'verify.erg')
+try:
+    with open(tcx_file, 'w') as f:
+        f.write(TCX)
+    with open(erg_file, 'w') as f:
+        f.write(ERG)
+    workout_name, steps = parse_tcx_workout(tcx_file)
+    _, power_profile = parse_erg_file(erg_file)
+finally:
+    os.remove(tcx_file)
+    os.remove(erg_file)
+    os.rmdir(tmp_dir)
+
+add_power_to_steps(steps, power_profile)
+cues = build_cue_timeline(steps, power_profile, RAMP_STEP)
+errors = []
+
+# Group the cues by the step whose start they follow
+cue_index = 0
+for step in steps:
+    start_sec = step['start_sec']
+    end_sec = step['end_sec']
+
+    offset, message = cues[cue_index]
+    if offset != start_sec or step['name'] not in message:
+        errors.append(f"{step['name']}: expected start cue at {start_sec}s, got {offset}s '{message}'")
+    cue_index += 1
+
+    ramp_cues = []
+    while cue_index < len(cues) - 1 and cues[cue_index][0] < end_sec:
+        ramp_cues.append(cues[cue_index])
+        cue_index += 1
+
+    expected_count = 0
+    if not step['is_steady']:
+        while start_sec + (expected_count + 1) * RAMP_STEP < end_sec:
+            expected_count += 1
+    if len(ramp_cues) != expected_count:
+        errors.append(f"{step['name']}: expected {expected_count} ramp updates, got {len(ramp_cues)}")
+
+    for k, (offset, message) in enumerate(ramp_cues, 1):
+        # Offsets must be start_sec + k * ramp_step, not a running sum
+        if offset != start_sec + k * RAMP_STEP:
+            errors.append(f"{step['name']} update {k}: offset {offset} != {start_sec + k * RAMP_STEP}")
+
+        # Targets must match get_power_at_time() after any transition
+        expected = int(round(get_power_at_time(power_profile, offset, use_end_value=True)))
+        if not message.endswith(f"target {expected}W"):
+            errors.append(f"{step['name']} update {k} ({offset}s): '{message}' != {expected}W")
+
+total_duration = sum(step['duration'] for step in steps)
+if not cues or cues[-1][0] != total_duration or not cues[-1][1].endswith("Workout complete"):
+    errors.append(f"final cue should be 'Workout complete' at {total_duration}s, got {cues[-1] if cues else None}")
+if cue_index != len(cues) - 1:
+    errors.append(f"{len(cues) - 1 - cue_index} unexpected cues after the last interval")
+
+print("=" * 60)
+print(f"Checked {len(cues)} cues for '{workout_name}' ({len(steps)} intervals, ramp step {RAMP_STEP}s)")
+if errors:
+    for error in errors[:20]:
+        print(f"❌ {error}")
+    if len(errors) > 20:
+        print(f"   ... and {len(errors) - 20} more")
+    print("=" * 60)
+    sys.exit(1)
+
+print("✅ Cue offsets, ramp targets and the final cue all match")
+print("=" * 60)